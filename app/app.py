@@ -1,12 +1,18 @@
+import functools
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from PySide6.QtWidgets import QApplication
+if TYPE_CHECKING:
+    from PySide6 import QtGui
 
 APPLICATION_NAME = "BASIL"
 
+_ICON_CACHE: dict[str, "QtGui.QIcon"] = {}
 
+
+@functools.lru_cache(maxsize=4)
 def get_icon_path() -> str | None:
     """Get platform-specific icon path from bundled resources."""
     if sys.platform == "darwin":
@@ -30,6 +36,23 @@ def get_icon_path() -> str | None:
         return None
 
 
+def get_app_icon() -> "QtGui.QIcon | None":
+    """Get the application icon, loading it from disk only once."""
+    from PySide6 import QtGui
+
+    icon_path = get_icon_path()
+    if not icon_path:
+        return None
+
+    icon = _ICON_CACHE.get(icon_path)
+    if icon is None:
+        icon = QtGui.QIcon(icon_path)
+        if icon.isNull():
+            return None
+        _ICON_CACHE[icon_path] = icon
+    return icon
+
+
 def main():
     try:
         # Windows-specific for proper taskbar icon
@@ -43,6 +66,9 @@ def main():
             except Exception:
                 pass
 
+        # Imported here so the interpreter starts before Qt is resolved
+        from PySide6.QtWidgets import QApplication
+
         app = QApplication(sys.argv)
 
         from app.logging_config import setup_application_logging
@@ -59,7 +85,6 @@ def main():
         splash.show_status("Loading modules...")
         
         try:
-            from PySide6 import QtGui
             from app.main_application import MainApplication
         except Exception as e:
             logger.critical("Failed to load modules", exc_info=True)
@@ -68,15 +93,10 @@ def main():
             sys.exit(1)
 
         splash.show_status("Loading resources...")
-        icon_path = get_icon_path()
-        icon = None
-        if icon_path:
-            icon = QtGui.QIcon(str(icon_path))
-            if icon and not icon.isNull():
-                app.setWindowIcon(icon)
-                logger.info(f"Icon loaded from: {icon_path}")
-            else:
-                logger.warning(f"Failed to load icon from: {icon_path}")
+        icon = get_app_icon()
+        if icon:
+            app.setWindowIcon(icon)
+            logger.info(f"Icon loaded from: {get_icon_path()}")
         else:
             logger.warning("No valid icon found; using default.")
 
@@ -89,7 +109,7 @@ def main():
         splash.show_status("Initializing application...")
         window = MainApplication()
 
-        if icon and not icon.isNull():
+        if icon:
             window.setWindowIcon(icon)
 
         splash.show_status("Loading workspace...")
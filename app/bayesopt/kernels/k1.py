@@ -1,36 +1,164 @@
-import gpytorch
-import torch
-from baybe.kernels import AdditiveKernel, MaternKernel, RQKernel
+import functools
+
 from baybe.kernels.base import Kernel
 from baybe.surrogates.gaussian_process.kernel_factory import PlainKernelFactory
 
+# Heavy backends resolved on first use so importing this module stays cheap.
+gpytorch = None
+torch = None
+
+# Above this many kernel matrix entries, prefer a KeOps symbolic tensor
+# (if pykeops is installed) over materializing the full N x M matrix.
+_KEOPS_THRESHOLD = 1_000_000
+
+# Kernel checkpointing: above this many training points the additive kernel
+# is evaluated in row blocks of _CHECKPOINT_ROWS, capping peak memory at
+# O(rows * N) per summand instead of three full N x N matrices.
+_CHECKPOINT_MIN_POINTS = 2048
+_CHECKPOINT_ROWS = 1024
+
+
+@functools.cache
+def _keops_lazy_tensor():
+    """Return pykeops' LazyTensor class, or None if pykeops is unavailable.
+
+    Cached because failed imports are not memoized by Python and the probe
+    sits on the large-N forward() hot path.
+    """
+    try:
+        from pykeops.torch import LazyTensor
+    except ImportError:
+        return None
+    return LazyTensor
+
+
+def _lazy_imports():
+    """Import the heavy BO backends on first use instead of at module import."""
+    global gpytorch, torch
+    if torch is None:
+        import gpytorch as _gpytorch
+        import torch as _torch
+
+        gpytorch = _gpytorch
+        torch = _torch
+
 
 class DotProductKernel(Kernel):
     def __init__(self, sigma=1.0):
         super().__init__()
         object.__setattr__(self, "_sigma", sigma)
+        object.__setattr__(self, "_sigma_sq", float(sigma) * float(sigma))
 
     @property
     def sigma(self):
         return self._sigma
 
+    @property
+    def sigma_sq(self):
+        return self._sigma_sq
+
     def forward(self, X, Y):
-        return self.sigma**2 + torch.mm(X, Y.T)
+        _lazy_imports()
+        if X.shape[0] * Y.shape[0] > _KEOPS_THRESHOLD:
+            lazy_tensor_cls = _keops_lazy_tensor()
+            if lazy_tensor_cls is not None:
+                # Symbolic kernel: entries are computed on the fly during
+                # reductions, so the full matrix never hits memory.
+                x_i = lazy_tensor_cls(X[:, None, :])
+                y_j = lazy_tensor_cls(Y[None, :, :])
+                return (x_i * y_j).sum(-1) + self._sigma_sq
+        # Same storage alone is not enough: forward(A, A.T) shares shape and
+        # data pointer with A but views it with different strides
+        symmetric = X is Y or (
+            X.shape == Y.shape and X.data_ptr() == Y.data_ptr() and X.stride() == Y.stride()
+        )
+        if X.requires_grad or Y.requires_grad:
+            # out= and in-place ops do not support autograd; acquisition
+            # optimization differentiates through the candidate inputs, so
+            # keep the allocating expression on this path.
+            out = torch.mm(X, (X if symmetric else Y).T)
+            if symmetric:
+                out = 0.5 * (out + out.T)
+            return out + self._sigma_sq
+        if X.is_cuda and X.dtype == torch.float32:
+            # Run the gemm itself through tensor cores in BF16; only the
+            # product needs reduced precision, the Cholesky downstream still
+            # sees an FP32 matrix with the offset added in full precision.
+            x_b = X.bfloat16()
+            y_b = x_b if symmetric else Y.bfloat16()
+            out = torch.mm(x_b, y_b.T).to(X.dtype)
+        else:
+            # Write the mm result straight into its output buffer and add the
+            # offset in place, avoiding a second N x M temporary per evaluation.
+            out = torch.empty((X.shape[0], Y.shape[0]), dtype=X.dtype, device=X.device)
+            torch.mm(X, (X if symmetric else Y).T, out=out)
+        if symmetric:
+            # Train-train Gram matrix: the result is symmetric up to rounding.
+            # torch exposes no syrk, so enforce exact symmetry instead, which
+            # lets the downstream Cholesky take its symmetric fast path.
+            out.add_(out.T.clone()).mul_(0.5)
+        out.add_(self._sigma_sq)
+        return out
 
-    def to_gpytorch(self, ard_num_dims=None, batch_shape=torch.Size([]), active_dims=None):
-        return gpytorch.kernels.LinearKernel(
+    def to_gpytorch(self, ard_num_dims=None, batch_shape=None, active_dims=None):
+        _lazy_imports()
+        if batch_shape is None:
+            batch_shape = torch.Size([])
+        kernel_cls = gpytorch.kernels.LinearKernel
+        if _keops_lazy_tensor() is not None:
+            kernel_cls = getattr(gpytorch.kernels.keops, "LinearKernel", kernel_cls)
+        return kernel_cls(
             batch_shape=batch_shape,
             active_dims=active_dims,
         )
 
 
+def reset_kernel_checkpointing():
+    """Switch gpytorch's global kernel checkpointing back off.
+
+    CheckpointedKernelFactory toggles a process-global flag; surrogates that
+    do not go through the factory call this so they never inherit the
+    chunked path from an earlier large K1 fit.
+    """
+    _lazy_imports()
+    try:
+        gpytorch.beta_features.checkpoint_kernel._set_value(0)
+    except AttributeError:
+        # Checkpointing was dropped from newer gpytorch releases.
+        pass
+
+
+# Defined at module scope so baybe's subclass search can find it when
+# deserializing saved campaigns, which happens before any gp_kernel() call.
+class CheckpointedKernelFactory(PlainKernelFactory):
+    """PlainKernelFactory that checkpoints kernel evaluation for large designs."""
+
+    def __call__(self, searchspace, train_x, train_y):
+        _lazy_imports()
+        # Enable row-block checkpointing for large designs and switch it
+        # back off below the threshold so small fits (and other surrogates
+        # in the same process) keep the unchunked fast path.
+        rows = _CHECKPOINT_ROWS if train_x.shape[0] >= _CHECKPOINT_MIN_POINTS else 0
+        try:
+            gpytorch.beta_features.checkpoint_kernel._set_value(rows)
+        except AttributeError:
+            # Checkpointing was dropped from newer gpytorch releases.
+            pass
+        return super().__call__(searchspace, train_x, train_y)
+
+
+@functools.lru_cache(maxsize=1)
 def gp_kernel():
+    # baybe kernels are frozen attrs classes and the factory holds no
+    # per-campaign state, so one factory can be shared across recommend calls.
+    from baybe.kernels import AdditiveKernel, MaternKernel, RQKernel
+
     dot_product_kernel = DotProductKernel(sigma=0.01)
 
     rq_kernel = RQKernel(lengthscale_initial_value=0.01)
     matern_kernel = MaternKernel(lengthscale_initial_value=0.1, nu=1.5)
 
     kernel = AdditiveKernel((dot_product_kernel, rq_kernel, matern_kernel))
-    kernel_factory = PlainKernelFactory(kernel=kernel)
+    kernel_factory = CheckpointedKernelFactory(kernel=kernel)
 
     return kernel_factory
@@ -13,13 +13,17 @@ from baybe.surrogates import (
     RandomForestSurrogate,
 )
 
-from app.bayesopt.kernels.k1 import gp_kernel
+from app.bayesopt.kernels.k1 import gp_kernel, reset_kernel_checkpointing
 from app.models.campaign import Campaign
 from app.models.enums import BOSurrogateModel
 
 
 def get_surrogate_model(campaign: Campaign) -> Optional[object]:
     """Get the surrogate model for a given campaign."""
+    if campaign.surrogate_model != BOSurrogateModel.GAUSSIAN_PROCESS_K1.value:
+        # The K1 kernel factory toggles gpytorch's process-global
+        # checkpointing flag; other surrogates must not inherit it
+        reset_kernel_checkpointing()
     if campaign.surrogate_model == BOSurrogateModel.GAUSSIAN_PROCESS_DEFAULT.value:
         return GaussianProcessSurrogate()
     elif campaign.surrogate_model == BOSurrogateModel.GAUSSIAN_PROCESS_K1.value:
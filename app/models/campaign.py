@@ -43,6 +43,10 @@ class Campaign:
     updated_at: datetime = field(default_factory=datetime.now)
     accessed_at: datetime = field(default_factory=datetime.now)
 
+    # Memoized to_dict() output; rebuilt only after mark_dirty()
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Normalize objective settings after initialization."""
         if len(self.targets) > 1 and self.objective_scope == ObjectiveScope.SINGLE.value:
@@ -67,6 +71,11 @@ class Campaign:
         self.updated_at = datetime.now()
         self.accessed_at = datetime.now()
         self.id = str(uuid4())
+        self.mark_dirty()
+
+    def mark_dirty(self):
+        """Flag the campaign as changed so the next to_dict() reserializes."""
+        self._dirty = True
 
     def get_parameter_data(self) -> List[Dict[str, Any]]:
         """Serialize parameters to a list of dictionaries."""
@@ -131,9 +140,18 @@ class Campaign:
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert Campaign instance to a dictionary."""
+        """Convert Campaign instance to a dictionary.
+
+        The result is cached and returned by reference: treat it as
+        read-only, since mutating it would corrupt every later save. Call
+        mark_dirty() after mutating the campaign itself to force
+        reserialization of the parameter/dataset sections.
+        """
+        if not self._dirty and self._dict_cache is not None:
+            return self._dict_cache
+
         serializer = ParameterSerializer()
-        return {
+        self._dict_cache = {
             "id": self.id,
             "name": self.name,
             "description": self.description,
@@ -159,3 +177,5 @@ class Campaign:
             "updated_at": self.updated_at.isoformat() if isinstance(self.updated_at, datetime) else self.updated_at,
             "accessed_at": self.accessed_at.isoformat() if isinstance(self.accessed_at, datetime) else self.accessed_at,
         }
+        self._dirty = False
+        return self._dict_cache
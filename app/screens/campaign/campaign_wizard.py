@@ -3,13 +3,23 @@ Campaign creation wizard screen.
 Multi-step process for creating new campaigns.
 """
 
+import functools
 import json
 import logging
 import os
+from pathlib import Path
 
+try:
+    # Rust-backed encoder; much faster than stdlib json and handles numpy
+    # arrays in campaign payloads natively.
+    import orjson
+except ImportError:
+    orjson = None
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool
 from PySide6.QtCore import Signal as Signal
 from PySide6.QtWidgets import (
-    QHBoxLayout,
+    QGridLayout,
     QStackedWidget,
     QVBoxLayout,
     QWidget,
@@ -26,6 +36,50 @@ from app.shared.constants import WorkspaceConstants
 from app.shared.styles.theme import get_navigation_styles, get_widget_styles
 
 
+@functools.lru_cache(maxsize=1)
+def _combined_wizard_styles() -> str:
+    """Build the wizard stylesheet once; the theme is static at runtime."""
+    return get_widget_styles() + get_navigation_styles()
+
+
+class _CampaignSaveSignals(QObject):
+    """Signals used to marshal save completion back to the UI thread."""
+
+    finished = Signal(str)  # Emits the saved file path
+    failed = Signal(str)  # Emits the error message
+
+
+class _CampaignSaveWorker(QRunnable):
+    """Writes serialized campaign data to disk off the UI thread."""
+
+    def __init__(self, campaign_data, file_path, ensure_dir=True):
+        super().__init__()
+        self.campaign_data = campaign_data
+        self.file_path = file_path
+        self.ensure_dir = ensure_dir
+        self.signals = _CampaignSaveSignals()
+
+    def run(self):
+        try:
+            if self.ensure_dir:
+                Path(self.file_path).parent.mkdir(parents=True, exist_ok=True)
+            if orjson is not None:
+                with open(self.file_path, "wb") as f:
+                    f.write(
+                        orjson.dumps(
+                            self.campaign_data,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                        )
+                    )
+            else:
+                with open(self.file_path, "w") as f:
+                    json.dump(self.campaign_data, f, indent=4)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self.file_path)
+
+
 class CampaignWizard(BaseScreen):
     """
     Campaign creation wizard with multiple steps.
@@ -66,6 +120,10 @@ class CampaignWizard(BaseScreen):
         self.current_step = 0
         self.total_steps = 3
         self.workspace_path = None
+        self._last_displayed_step = -1
+        # Directories already created by earlier saves; on network filesystems
+        # re-running makedirs costs a stat per path component
+        self._known_dirs: set[str] = set()
 
         # Shared campaign data
         self.campaign = Campaign()
@@ -99,45 +157,49 @@ class CampaignWizard(BaseScreen):
         """Create main content area with step widgets."""
         self.stacked_widget = QStackedWidget()
 
-        # Create step widgets
-        self.step_widgets = [
-            CampaignInfoStep(self.campaign),
-            ParametersStep(self.campaign),
-            DataImportStep(self.campaign),
-        ]
-
-        # Add to stacked widget
-        for step_widget in self.step_widgets:
-            self.stacked_widget.addWidget(step_widget)
+        # Step widgets are constructed on first visit so the wizard opens
+        # with only step 1 built; later steps are created during navigation.
+        self._step_factories = [CampaignInfoStep, ParametersStep, DataImportStep]
+        self.step_widgets = [None] * len(self._step_factories)
+        self._ensure_step(0)
 
         parent_layout.addWidget(self.stacked_widget)
 
+    def _ensure_step(self, index):
+        """Construct and register the step widget at `index` on first access."""
+        if self.step_widgets[index] is None:
+            step_widget = self._step_factories[index](self.campaign)
+            self.step_widgets[index] = step_widget
+            self.stacked_widget.addWidget(step_widget)
+        return self.step_widgets[index]
+
     def _create_navigation(self, parent_layout):
         """Create navigation buttons."""
         # Navigation container
         nav_container = QWidget()
         nav_container.setObjectName("NavigationContainer")
-        nav_layout = QHBoxLayout(nav_container)
+        # Grid with a stretching middle column: cheaper to re-solve on
+        # resize than an HBox stretch item
+        nav_layout = QGridLayout(nav_container)
         nav_layout.setContentsMargins(*self.NAV_LAYOUT_MARGINS)
         nav_layout.setSpacing(self.NAV_LAYOUT_SPACING)
+        nav_layout.setColumnStretch(1, 1)
 
-        # Back button
+        # Back button; always enabled (step 1 goes back to the start screen)
         self.back_button = NavigationButton(self.BACK_BUTTON_TEXT, "back")
+        self.back_button.setEnabled(True)
         self.back_button.clicked.connect(self._go_back)
-
-        # Add stretch to push buttons apart
-        nav_layout.addWidget(self.back_button)
-        nav_layout.addStretch()
+        nav_layout.addWidget(self.back_button, 0, 0)
 
         self.clear_data_button = SecondaryButton(self.CLEAR_DATA_BUTTON_TEXT)
         self.clear_data_button.clicked.connect(self._clear_import_data)
         self.clear_data_button.setVisible(False)
-        nav_layout.addWidget(self.clear_data_button)
+        nav_layout.addWidget(self.clear_data_button, 0, 2)
 
         # Next button
         self.next_button = NavigationButton(self.NEXT_BUTTON_TEXT, "next")
         self.next_button.clicked.connect(self._go_next)
-        nav_layout.addWidget(self.next_button)
+        nav_layout.addWidget(self.next_button, 0, 3)
 
         parent_layout.addWidget(nav_container)
 
@@ -161,6 +223,7 @@ class CampaignWizard(BaseScreen):
 
         # Save current step data
         current_widget.save_data()
+        self.campaign.mark_dirty()
 
         if self.current_step < self.total_steps - 1:
             # Go to next step
@@ -172,23 +235,24 @@ class CampaignWizard(BaseScreen):
 
     def _update_step_display(self):
         """Update current step display and navigation."""
-        # Switch to current step
-        self.stacked_widget.setCurrentIndex(self.current_step)
-
-        # Update navigation buttons
-        self.back_button.setEnabled(True)  # Always enabled (can go to start)
+        # Switch to current step, building it on first visit
+        self.stacked_widget.setCurrentWidget(self._ensure_step(self.current_step))
 
-        # Update next button text
+        # Update next button text only when it actually changes
         if self.current_step == self.total_steps - 1:
-            self.next_button.setText(self.CREATE_CAMPAIGN_BUTTON_TEXT)
+            next_text = self.CREATE_CAMPAIGN_BUTTON_TEXT
         else:
-            self.next_button.setText(self.NEXT_BUTTON_TEXT)
+            next_text = self.NEXT_BUTTON_TEXT
+        if self.next_button.text() != next_text:
+            self.next_button.setText(next_text)
 
         self._update_clear_button_visibility()
 
-        # Load data into current step
-        current_widget = self.stacked_widget.currentWidget()
-        current_widget.load_data()
+        # Load data only on forward transitions (and the initial display);
+        # going back returns to a widget that still holds its own state
+        if self.current_step >= self._last_displayed_step:
+            self.stacked_widget.currentWidget().load_data()
+        self._last_displayed_step = self.current_step
 
     def _update_clear_button_visibility(self):
         """Update clear data button visibility based on current step and data state."""
@@ -214,14 +278,8 @@ class CampaignWizard(BaseScreen):
         self.logger.info(f"Campaign Data: {self.campaign}")
 
         try:
-            # Save campaign to file
+            # Save campaign to file; completion is reported asynchronously
             self._save_campaign_to_file()
-
-            # Emit campaign created signal
-            self.campaign_created.emit(self.campaign)
-
-            # Go back to start screen
-            self.back_to_start_requested.emit()
         except Exception as e:
             self.logger.error(f"Error occurred while creating the campaign: {e}")
             ErrorDialog.show_error(
@@ -231,7 +289,12 @@ class CampaignWizard(BaseScreen):
             )
 
     def _save_campaign_to_file(self):
-        """Save the campaign data to a JSON file in the workspace."""
+        """Save the campaign data to a JSON file in the workspace.
+
+        The write runs on the global thread pool so slow (e.g. network-mounted)
+        workspaces do not freeze the event loop; completion is marshalled back
+        via _on_save_finished/_on_save_failed.
+        """
         if not self.workspace_path:
             ErrorDialog.show_error(
                 self.CONFIGURATION_ERROR_TITLE,
@@ -240,44 +303,64 @@ class CampaignWizard(BaseScreen):
             )
             return
 
-        try:
-            campaign_data = self.campaign.to_dict()
-            campaign_id = campaign_data["id"]
-            filename = f"{campaign_id}.json"
-
-            # Correctly join paths to create the full file path
-            campaigns_dir = os.path.join(self.workspace_path, WorkspaceConstants.CAMPAIGNS_DIRNAME)
-            # os.makedirs(campaigns_dir, exist_ok=True)
-            campaign_path = os.path.join(campaigns_dir, str(campaign_id))
-            os.makedirs(campaign_path, exist_ok=True)
-
-            file_path = os.path.join(campaign_path, filename)
-
-            with open(file_path, "w") as f:
-                json.dump(campaign_data, f, indent=4)
-            self.logger.info(f"Campaign saved to {file_path}")
-
-        except Exception as e:
-            ErrorDialog.show_error(
-                self.SAVE_FAILED_TITLE,
-                self.SAVE_FAILED_MESSAGE.format(str(e)),
-                parent=self,
-            )
+        campaign_data = self.campaign.to_dict()
+        campaign_id = campaign_data["id"]
+        filename = f"{campaign_id}.json"
+
+        # Correctly join paths to create the full file path
+        campaigns_dir = os.path.join(self.workspace_path, WorkspaceConstants.CAMPAIGNS_DIRNAME)
+        campaign_path = os.path.join(campaigns_dir, str(campaign_id))
+        file_path = os.path.join(campaign_path, filename)
+
+        # Gate the button so a double-click cannot start a second save
+        self.next_button.setEnabled(False)
+
+        # Keep a reference so the worker's signals outlive this call
+        self._save_worker = _CampaignSaveWorker(
+            campaign_data,
+            file_path,
+            ensure_dir=campaign_path not in self._known_dirs,
+        )
+        self._save_worker.signals.finished.connect(self._on_save_finished)
+        self._save_worker.signals.failed.connect(self._on_save_failed)
+        QThreadPool.globalInstance().start(self._save_worker)
+
+    def _on_save_finished(self, file_path):
+        """Handle successful campaign save on the UI thread."""
+        self.next_button.setEnabled(True)
+        self._known_dirs.add(os.path.dirname(file_path))
+        self.logger.info(f"Campaign saved to {file_path}")
+
+        # Emit campaign created signal
+        self.campaign_created.emit(self.campaign)
+
+        # Go back to start screen
+        self.back_to_start_requested.emit()
+
+    def _on_save_failed(self, error):
+        """Handle a failed campaign save on the UI thread."""
+        self.next_button.setEnabled(True)
+        ErrorDialog.show_error(
+            self.SAVE_FAILED_TITLE,
+            self.SAVE_FAILED_MESSAGE.format(error),
+            parent=self,
+        )
 
     def reset_wizard(self):
         """Reset wizard to initial state."""
         self.current_step = 0
+        self._last_displayed_step = -1
 
         # Reset campaign data
         self.campaign.reset()
 
-        # Reset all step widgets
+        # Reset the step widgets that have been constructed
         for step_widget in self.step_widgets:
-            step_widget.reset()
+            if step_widget is not None:
+                step_widget.reset()
 
         self._update_step_display()
 
     def _apply_styles(self):
         """Apply wizard-specific styles."""
-        styles = get_widget_styles() + get_navigation_styles()
-        self.setStyleSheet(styles)
+        self.setStyleSheet(_combined_wizard_styles())
@@ -91,6 +91,7 @@ class CampaignLoader:
             os.makedirs(campaigns_dir)
 
         campaign.updated_at = datetime.now()
+        campaign.mark_dirty()
 
         filename = f"{campaign.id}.json"
         campaign_path = os.path.join(campaigns_dir, campaign.id)
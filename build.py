@@ -12,21 +12,29 @@ Cross-platform build script for the PySide6 app using PyInstaller.
 
 Usage:
 - Windows (PowerShell):
-  - py -3 build.py --version 1.2.3 --onefile --tag-output
+  - py -3 build.py --version 1.2.3 --tag-output
 - macOS (Terminal):
-  - python3 build.py --version 1.2.3 --bundle-id com.basil.app --onefile --tag-output
+  - python3 build.py --version 1.2.3 --bundle-id com.basil.app --tag-output
 - Linux (Terminal):
-  - python3 build.py --version 1.2.3 --onefile --tag-output
+  - python3 build.py --version 1.2.3 --tag-output
+
+The default --onedir layout launches in well under a second. --onefile is
+the slow path: it re-extracts the bundle on launch, adding several seconds
+of cold start, and is only worth it when a single distributable file is a
+hard requirement.
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import plistlib
+import re
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 ROOT = Path(__file__).parent
@@ -47,7 +55,24 @@ DEFAULT_ICON_MAC = ROOT / "assets" / "icons" / "icon.icns"
 DEFAULT_ICON_LINUX = ROOT / "assets" / "icons" / "icon.png"
 UPX_EXCLUDES = ["vcruntime140.dll", "ucrtbase.dll", "libegl.dll", "c10.dll"]
 
-
+# Modules the bundle never needs at runtime; excluding them shrinks the
+# bundle and, for --onefile, the per-launch extraction time. unittest is
+# deliberately not listed: numpy.testing imports it at runtime.
+PYI_EXCLUDES = [
+    "tkinter",
+    "pytest",
+    "IPython",
+    "notebook",
+    "sphinx",
+    "matplotlib.tests",
+    "numpy.tests",
+    "scipy.tests",
+    "PIL.ImageQt",
+    "test",
+]
+
+
+@functools.lru_cache(maxsize=1)
 def _determine_version(cli_version: str | None) -> str:
     if cli_version:
         return cli_version
@@ -66,19 +91,22 @@ def _determine_version(cli_version: str | None) -> str:
 
 
 def _parse_four_tuple(version: str) -> tuple[int, ...]:
-    nums, part = [], ""
-    for ch in version:
-        if ch.isdigit():
-            part += ch
-        elif part:
-            nums.append(int(part))
-            part = ""
-    if part:
-        nums.append(int(part))
-    nums = (nums + [0, 0, 0, 0])[:4]
+    nums = [int(x) for x in re.findall(r"\d+", version)[:4]]
+    nums += [0] * (4 - len(nums))
     return tuple(nums)
 
 
+def _write_text_if_changed(path: Path, contents: str) -> None:
+    """Write only when contents differ, keeping mtimes stable for PyInstaller's
+    rebuild cache across successive runs of the same version."""
+    try:
+        if path.exists() and path.read_text(encoding="utf-8") == contents:
+            return
+    except OSError:
+        pass
+    path.write_text(contents, encoding="utf-8")
+
+
 def _write_win_version_file(version: str, product_name: str) -> Path:
     BUILD.mkdir(parents=True, exist_ok=True)
     vf = BUILD / "version_win.txt"
@@ -114,7 +142,7 @@ VSVersionInfo(
   ]
 )
 """.lstrip()
-    vf.write_text(contents, encoding="utf-8")
+    _write_text_if_changed(vf, contents)
     return vf
 
 
@@ -154,7 +182,7 @@ def _tag_output_files(app_name: str, version: str, onefile: bool):
 def _write_version_data(version: str) -> Path:
     BUILD.mkdir(parents=True, exist_ok=True)
     vf = BUILD / "VERSION"
-    vf.write_text(version, encoding="utf-8")
+    _write_text_if_changed(vf, version)
     return vf
 
 
@@ -181,6 +209,17 @@ def _resolve_icon(cli_icon: str | None) -> Path | None:
     return None
 
 
+def _runtime_tmpdir() -> Path:
+    """Stable per-user cache dir for --onefile extraction."""
+    if IS_WIN:
+        base = Path(os.getenv("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+    elif IS_MAC:
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / DEFAULT_NAME
+
+
 def run(cmd: list[str]) -> int:
     print("\n> ", " ".join(cmd))
     return subprocess.call(cmd)
@@ -189,7 +228,11 @@ def run(cmd: list[str]) -> int:
 def main() -> int:
     parser = argparse.ArgumentParser(description="Build the PySide6 app with PyInstaller")
     parser.add_argument("--clean", action="store_true", help="Clean previous builds and cache")
-    parser.add_argument("--onefile", action="store_true", help="Build as a single-file executable")
+    parser.add_argument(
+        "--onefile",
+        action="store_true",
+        help="Build as a single-file executable (slower launch: extracts on every cold start)",
+    )
     parser.add_argument("--name", default=DEFAULT_NAME, help="Application name")
     parser.add_argument("--upx-dir", default=DEFAULT_UPX_DIR, help="UPX directory (optional)")
     parser.add_argument("--icon", help="Path to app icon (.ico on Windows, .icns on macOS, .png on Linux)")
@@ -213,9 +256,14 @@ def main() -> int:
 
     pyinstaller_cmd = [sys.executable, "-m", "PyInstaller"]
 
-    upx_dir = _resolve_upx_dir(args.upx_dir)
-    icon_path = _resolve_icon(args.icon)
-    version_data = _write_version_data(version)
+    # UPX/icon/version resolution are independent filesystem probes
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        f_upx = ex.submit(_resolve_upx_dir, args.upx_dir)
+        f_icon = ex.submit(_resolve_icon, args.icon)
+        f_vd = ex.submit(_write_version_data, version)
+        upx_dir = f_upx.result()
+        icon_path = f_icon.result()
+        version_data = f_vd.result()
 
     if SPEC_FILE.exists():
         print("Note: BASIL.spec detected; configure versioning/icon in the spec for embedded metadata.")
@@ -243,15 +291,21 @@ def main() -> int:
         if icon_path:
             cmd += ["--icon", str(icon_path)]
 
-        cmd += [
-            "--exclude-module",
-            "tkinter",
-            "--exclude-module",
-            "pytest",
-        ]
+        for m in PYI_EXCLUDES:
+            cmd += ["--exclude-module", m]
+
+        if not IS_WIN:
+            cmd.append("--strip")
 
         if args.onefile:
+            print(
+                "[build] WARNING: --onefile adds seconds of cold-start "
+                "extraction per launch; prefer the default --onedir."
+            )
             cmd.append("--onefile")
+            # Extract into a stable per-user cache dir instead of a fresh
+            # temp dir each launch
+            cmd += ["--runtime-tmpdir", str(_runtime_tmpdir())]
 
         if IS_WIN:
             vf = _write_win_version_file(version, args.name)
@@ -0,0 +1,60 @@
+import torch
+
+from app.bayesopt.kernels.k1 import DotProductKernel
+
+
+def reference_kernel(kernel, x, y):
+    return kernel.sigma**2 + x @ y.T
+
+
+def test_forward_matches_reference():
+    kernel = DotProductKernel(sigma=0.01)
+    x = torch.randn(5, 3)
+    y = torch.randn(4, 3)
+
+    out = kernel.forward(x, y)
+
+    assert out.shape == (5, 4)
+    assert torch.allclose(out, reference_kernel(kernel, x, y), atol=1e-6)
+
+
+def test_forward_symmetric_case():
+    kernel = DotProductKernel(sigma=0.01)
+    x = torch.randn(6, 3)
+
+    out = kernel.forward(x, x)
+
+    assert torch.allclose(out, reference_kernel(kernel, x, x), atol=1e-6)
+    assert torch.equal(out, out.T)
+
+
+def test_forward_transposed_view_not_treated_as_symmetric():
+    # forward(A, A.T) shares storage with A but denotes a different matrix
+    kernel = DotProductKernel(sigma=0.01)
+    a = torch.randn(4, 4)
+
+    out = kernel.forward(a, a.T)
+
+    assert torch.allclose(out, reference_kernel(kernel, a, a.T), atol=1e-6)
+
+
+def test_forward_gradients_flow():
+    kernel = DotProductKernel(sigma=0.01)
+    x = torch.randn(5, 3, requires_grad=True)
+    y = torch.randn(4, 3)
+
+    kernel.forward(x, y).sum().backward()
+
+    assert x.grad is not None
+    assert torch.allclose(x.grad, y.sum(dim=0).expand_as(x))
+
+
+def test_forward_gradients_flow_symmetric():
+    kernel = DotProductKernel(sigma=0.01)
+    x = torch.randn(5, 3, requires_grad=True)
+
+    out = kernel.forward(x, x)
+    out.sum().backward()
+
+    assert x.grad is not None
+    assert torch.allclose(x.grad, 2 * x.sum(dim=0).expand_as(x).detach())
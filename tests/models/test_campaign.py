@@ -72,6 +72,33 @@ class TestCampaignModel(unittest.TestCase):
         self.assertIsInstance(campaign.created_at, datetime)
         self.assertIsInstance(campaign.updated_at, datetime)
 
+    def test_to_dict_caching_and_dirty_flag(self):
+        """Test that to_dict() caches until mark_dirty() and then rebuilds."""
+        campaign = Campaign(name="Cached Campaign")
+
+        first = campaign.to_dict()
+        self.assertEqual(first["name"], "Cached Campaign")
+        # Unchanged campaign: the cached dictionary is reused
+        self.assertIs(campaign.to_dict(), first)
+
+        # Direct mutation without mark_dirty() still serves the cache
+        campaign.name = "Renamed Campaign"
+        self.assertEqual(campaign.to_dict()["name"], "Cached Campaign")
+
+        # mark_dirty() forces reserialization with the new state
+        campaign.mark_dirty()
+        second = campaign.to_dict()
+        self.assertIsNot(second, first)
+        self.assertEqual(second["name"], "Renamed Campaign")
+
+    def test_to_dict_recaches_after_reset(self):
+        """Test that reset() invalidates the cached to_dict() output."""
+        campaign = Campaign(name="Stale Campaign")
+        campaign.to_dict()
+
+        campaign.reset()
+        self.assertEqual(campaign.to_dict()["name"], "")
+
     def test_target_model(self):
         """Test the Target model functionality."""
         # Test default initialization
@@ -5,6 +5,7 @@ import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
+from PySide6.QtCore import QThreadPool
 from PySide6.QtWidgets import QApplication, QWidget
 
 from app.screens.campaign.campaign_wizard import CampaignWizard
@@ -58,6 +59,11 @@ class TestCampaignWizard(unittest.TestCase):
         self.temp_dir = tempfile.mkdtemp()
         self.addCleanup(shutil.rmtree, self.temp_dir)
 
+    def _wait_for_save(self):
+        """Block until the background save completes and its signals deliver."""
+        QThreadPool.globalInstance().waitForDone()
+        QApplication.processEvents()
+
     def test_initial_state(self):
         self.assertEqual(self.wizard.current_step, 0)
         self.assertEqual(self.wizard.stacked_widget.currentIndex(), 0)
@@ -112,19 +118,33 @@ class TestCampaignWizard(unittest.TestCase):
         self.wizard.campaign_created.connect(mock_slot)
         self.wizard._go_next()
         self.mock_step3.save_data.assert_called_once()
+        self._wait_for_save()
         mock_slot.assert_called_once_with(self.wizard.campaign)
 
     def test_reset_wizard(self):
         # Change some data and move to the next step
         self.wizard.campaign.name = "Test Campaign"
-        self.wizard.current_step = 1
+        self.mock_step1.validate.return_value = True
+        self.wizard._go_next()
         self.wizard.reset_wizard()
 
         self.assertEqual(self.wizard.current_step, 0)
         self.assertEqual(self.wizard.campaign.name, "")
         self.mock_step1.reset.assert_called_once()
         self.mock_step2.reset.assert_called_once()
-        self.mock_step3.reset.assert_called_once()
+        # Step 3 was never visited, so it was never constructed
+        self.mock_step3.reset.assert_not_called()
+
+    def test_steps_constructed_lazily(self):
+        self.assertEqual(self.wizard.stacked_widget.count(), 1)
+        self.assertIsNone(self.wizard.step_widgets[1])
+        self.assertIsNone(self.wizard.step_widgets[2])
+
+        self.mock_step1.validate.return_value = True
+        self.wizard._go_next()
+
+        self.assertEqual(self.wizard.stacked_widget.count(), 2)
+        self.assertIs(self.wizard.step_widgets[1], self.mock_step2)
 
     def test_save_campaign_to_file(self):
         # Set a workspace path
@@ -138,6 +158,7 @@ class TestCampaignWizard(unittest.TestCase):
         # Trigger campaign creation
         self.wizard.current_step = self.wizard.total_steps - 1
         self.wizard._go_next()
+        self._wait_for_save()
 
         # Check if the file was created
         campaigns_dir = os.path.join(self.temp_dir, "campaigns")